@@ -3,7 +3,7 @@
 
 This script merges a *default* INI config with an optional *repo-specific* INI
 config, writing the merged result to an output path. If the repo-specific
-config file does not exist, the default config is written as-is.
+config file does not exist, the default config is copied as-is.
 
 Notes
 -----
@@ -23,8 +23,9 @@ From the command line::
 """
 import argparse
 import configparser
-import sys
 from pathlib import Path
+import shutil
+import sys
 
 
 def merge_configs(default_path: str, repo_path: str, output_path: str) -> None:
@@ -36,7 +37,7 @@ def merge_configs(default_path: str, repo_path: str, output_path: str) -> None:
         Path to the default INI-style configuration file.
     repo_path : str
         Path to the repo-specific INI-style configuration file. If this file
-        does not exist, the default config is used without modification.
+        does not exist, the default config is copied without modification.
     output_path : str
         Path to write the merged INI configuration.
 
@@ -45,22 +46,17 @@ def merge_configs(default_path: str, repo_path: str, output_path: str) -> None:
     None
         This function writes the merged configuration to ``output_path``.
     """
-    # Read default config
-    config = configparser.ConfigParser()
-    config.read(default_path)
-
-    # Read and merge repo config if it exists
-    repo_file = Path(repo_path)
-    if repo_file.exists():
-        config_repo = configparser.ConfigParser()
-        config_repo.read(repo_path)
-
-        # Merge: repo config overrides default
-        for section in config_repo.sections():
-            if not config.has_section(section):
-                config.add_section(section)
-            for key, value in config_repo.items(section):
-                config.set(section, key, value)
+    # Without a repo config there is nothing to merge, so copy the default
+    # file directly. This also preserves its comments and formatting.
+    if not Path(repo_path).exists():
+        shutil.copyfile(default_path, output_path)
+        return
+
+    # Read default config, then the repo config on top of it so that repo
+    # values override defaults. A raw parser is used so values are copied
+    # verbatim without interpolation.
+    config = configparser.RawConfigParser()
+    config.read([default_path, repo_path])
 
     # Write merged config
     with open(output_path, "w") as f:
@@ -10,17 +10,21 @@ with open(args.filename) as f:
 
 # the .github repo doesn't appear somehow
 repos = ["scritical/.github"]
+# track names already added, for constant-time dedup while keeping order
+seen = set(repos)
 
 # remove archived repos
 # or ones with the 'paper' tag
 for d in data["data"]["organization"]["repositories"]["nodes"]:
-    if not d["isArchived"]:
-        topics = [t["topic"]["name"] for t in d["repositoryTopics"]["nodes"]]
-        if "paper" not in topics:
-            repoName = d["nameWithOwner"]
-            if repoName not in repos:
-                repos.append(repoName)
+    if d["isArchived"]:
+        continue
+    if any(t["topic"]["name"] == "paper" for t in d["repositoryTopics"]["nodes"]):
+        continue
+    repoName = d["nameWithOwner"]
+    if repoName not in seen:
+        seen.add(repoName)
+        repos.append(repoName)
 
 # write out the list
 with open(args.output_filename, mode="w") as f:
-    f.writelines("\n".join(repos) + "\n")
+    f.write("\n".join(repos) + "\n")